@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
-import os, json, time, socket, shutil, subprocess, struct, random
-from datetime import datetime
-from typing import List, Dict, Any
+import os, json, time, socket, shutil, struct, random, asyncio, mmap, collections, threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterator
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
 import psutil
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # optional; stdlib json also accepts bytes
+    orjson = None
+    json_loads = json.loads
+
 # ---------- CONFIG ----------
 OWNCLOUD_LOG = os.environ.get("OWNCLOUD_LOG", "/var/www/owncloud/data/owncloud.log")  # adjust to your path
 BACKUP_SUMMARY = os.environ.get("BACKUP_SUMMARY", "/var/log/vps-backup.json")
@@ -19,75 +28,239 @@ MC_HOST = os.environ.get("MC_HOST", "127.0.0.1")
 MC_PORT = int(os.environ.get("MC_PORT", 19132))
 MC_CONTAINER = os.environ.get("MC_CONTAINER", "bedrock")
 MC_TIMEOUT = 2.0
+DASHBOARD_ORIGIN = [o.strip() for o in os.environ.get("DASHBOARD_ORIGIN", "http://localhost:3000").split(",") if o.strip()]  # comma-separated
+METRICS_TTL = 2.0
+CPU_SAMPLE_INTERVAL = 1.0
+PARTITIONS_TTL = 60.0
+DISK_FSTYPES = {"ext4", "ext3", "xfs", "btrfs", "zfs"}
+DISK_SKIP_PREFIXES = ("/snap", "/var/lib/docker", "/run", "/sys", "/proc")
+DISK_USAGE_TIMEOUT = 0.25  # a stale (e.g. NFS) mount is skipped rather than hanging metrics
+MC_CACHE_TTL = 5.0
+VPN_CACHE_TTL = 3.0
+STALE_MAX_AGE = 60.0   # how long a last-good probe result may stand in for a failed one
 # ----------------------------
 
-app = FastAPI(title="VPS Dashboard API")
+HOSTNAME = socket.gethostname()
+
+app = FastAPI(
+    title="VPS Dashboard API",
+    default_response_class=ORJSONResponse if orjson else JSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
+    allow_origins=DASHBOARD_ORIGIN, allow_methods=["GET"], allow_headers=["Accept", "Content-Type"]
 )
 
+def cache_headers(ttl: int, swr: int):
+    """
+    Route dependency that lets the browser reuse a response for ttl seconds and
+    serve it stale for another swr while revalidating. "private" because /api is
+    behind basic auth; shared caches must not store it. Vary: Origin is set here
+    since CORSMiddleware only adds it for some requests on older Starlette.
+    """
+    def set_headers(response: Response):
+        response.headers["Cache-Control"] = f"private, max-age={ttl}, stale-while-revalidate={swr}"
+        vary = response.headers.get("Vary")
+        if not vary:
+            response.headers["Vary"] = "Origin"
+        elif "origin" not in [v.strip().lower() for v in vary.split(",")]:
+            response.headers["Vary"] = f"{vary}, Origin"
+    return Depends(set_headers)
+
+_UNITS = ("B","KB","MB","GB","TB","PB")
+
 def fmt_bytes(b: int) -> str:
-    for unit in ["B","KB","MB","GB","TB"]:
-        if b < 1024: return f"{b:.1f} {unit}"
-        b/=1024
-    return f"{b:.1f} PB"
+    if b < 1024: return f"{b:.1f} B"
+    # each unit is 2**10 of the previous, so the bit length picks it directly
+    i = min((int(b).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{b / (1 << (i*10)):.1f} {_UNITS[i]}"
+
+def to_int(s: str) -> int:
+    return int(s) if s.isdigit() else 0
 
-def try_cmd(cmd: List[str]) -> str:
+async def try_cmd(cmd: List[str], timeout: float = 2) -> str:
     try:
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=2)
-        return out.strip()
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+        )
     except Exception:
         return ""
+    try:
+        out, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass  # exited just now
+        except PermissionError:
+            # e.g. sudo running as root; asyncio's child watcher reaps it once it exits
+            return ""
+        await proc.wait()
+        return ""
+    if proc.returncode != 0:
+        return ""
+    return out.decode("utf-8", errors="replace").strip()
 
-def tail_file(path: str, n: int) -> List[str]:
+def tail_offset(mm: mmap.mmap, n: int, end: int) -> int:
+    """Offset at which the last n lines of mm[:end] start."""
+    # scan backwards for the n-th newline; a trailing one doesn't start a line
+    pos = end - 1 if mm[end-1:end] == b"\n" else end
+    for _ in range(n):
+        pos = mm.rfind(b"\n", 0, pos)
+        if pos < 0:
+            break
+    return pos + 1
+
+def iter_tail_bytes(path: str, n: int) -> Iterator[bytes]:
     try:
         with open(path, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            size = f.tell()
-            block = 1024
-            data = b""
-            while size > 0 and data.count(b"\n") <= n:
-                step = min(block, size)
-                size -= step
-                f.seek(size)
-                data = f.read(step) + data
-            lines = data.decode("utf-8", errors="replace").splitlines()
-            return lines[-n:]
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap refuses empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = mm[tail_offset(mm, n, len(mm)):]
     except Exception:
-        return []
+        return
+    # data holds at most n lines; hand them out one at a time
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = len(data)
+        yield data[start:end]
+        start = end + 1
+
+def tail_file(path: str, n: int) -> List[str]:
+    return [L.decode("utf-8", errors="replace") for L in iter_tail_bytes(path, n)]
     
-def bedrock_status(host: str, port: int):
+def file_key(path: str):
+    """Identity of a file's current contents: (inode, size, mtime_ns), or None if missing."""
+    try:
+        st = os.stat(path)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    except OSError:
+        return None
+
+# UNCONNECTED_PING (0x01): 0x01 + 8-byte time + 16-byte magic + 8-byte client GUID
+RAKNET_MAGIC = b"\x00\xff\xff\x00\xfe\xfe\xfe\xfe\xfd\xfd\xfd\xfd\x12\x34\x56\x78"
+_PING = struct.Struct(">BQ16sQ")
+_CLIENT_GUID = random.getrandbits(64)  # RakNet doesn't need a fresh GUID per ping
+
+# One UDP socket per Bedrock server, kept open across pings; pings are serialized
+_br_socks: Dict[tuple, socket.socket] = {}
+_br_lock = asyncio.Lock()
+
+def bedrock_socket(host: str, port: int) -> socket.socket:
+    s = _br_socks.get((host, port))
+    if s is None:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.setblocking(False)
+        s.connect((host, port))
+        _br_socks[(host, port)] = s
+    return s
+
+def drop_bedrock_socket(host: str, port: int):
+    s = _br_socks.pop((host, port), None)
+    if s is not None:
+        s.close()
+
+# Per-probe TTL cache with a last-known-good slot for stale fallback
+_ttl_store: Dict[str, Dict[str, Any]] = {}
+# Probes currently running, so concurrent cache misses share one result
+_inflight: Dict[str, asyncio.Future] = {}
+
+async def single_flight(key: str, coro_factory):
+    while True:
+        fut = _inflight.get(key)
+        if fut is None:
+            break
+        try:
+            # shield so a cancelled waiter doesn't cancel the shared future
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            if not fut.cancelled():
+                raise  # this request itself was cancelled
+            # the leading request was cancelled; take over the probe
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await coro_factory()
+    except asyncio.CancelledError:
+        if not fut.done():
+            fut.cancel()
+        raise
+    except Exception as e:
+        if not fut.done():
+            fut.set_exception(e)
+            fut.exception()  # don't warn about it if no other request was waiting
+        raise
+    else:
+        if not fut.done():
+            fut.set_result(result)
+        return result
+    finally:
+        if _inflight.get(key) is fut:
+            del _inflight[key]
+
+async def ttl_cache(key: str, ttl: float, fn, ok=lambda v: True):
     """
-    Unconnected RakNet ping (Bedrock). Returns dict with online, motd, version, players, max_players.
+    Return fn()'s result, reusing it for ttl seconds. If the probe raises or
+    ok(result) is false, serve the last good result (marked "stale") as long
+    as it is younger than STALE_MAX_AGE. Concurrent misses run fn() once.
     """
+    entry = _ttl_store.setdefault(key, {"value": None, "expires": 0.0, "good": None, "good_at": 0.0})
+    if time.monotonic() < entry["expires"]:
+        return entry["value"]
+    return await single_flight(key, lambda: _refresh(entry, ttl, fn, ok))
+
+async def _refresh(entry: Dict[str, Any], ttl: float, fn, ok):
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(MC_TIMEOUT)
+        value, err = await fn(), None
+    except Exception as e:
+        value, err = None, e
+    now = time.monotonic()
+    if err is None and ok(value):
+        entry["good"], entry["good_at"] = value, now
+    elif entry["good"] is not None and now - entry["good_at"] < STALE_MAX_AGE:
+        value = {**entry["good"], "stale": True}
+    elif err is not None:
+        raise err
+    entry["value"], entry["expires"] = value, now + ttl
+    return value
 
-        # Build UNCONNECTED_PING (0x01)
-        # 0x01 + 8-byte time + 16-byte magic + 8-byte client GUID
-        magic = b"\x00\xff\xff\x00\xfe\xfe\xfe\xfe\xfd\xfd\xfd\xfd\x12\x34\x56\x78"
-        payload = b"\x01" + struct.pack(">Q", int(time.time()*1000)) + magic + struct.pack(">Q", random.getrandbits(64))
-        s.sendto(payload, (host, port))
+async def bedrock_status(host: str, port: int):
+    """
+    Unconnected RakNet ping (Bedrock). Returns dict with online, motd, version, players, max_players.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        async with _br_lock:
+            s = bedrock_socket(host, port)
+            payload = _PING.pack(0x01, int(time.time()*1000), RAKNET_MAGIC, _CLIENT_GUID)
+            await loop.sock_sendall(s, payload)
 
-        data, _ = s.recvfrom(2048)  # expect UNCONNECTED_PONG (0x1C)
-        s.close()
+            # expect UNCONNECTED_PONG (0x1C), which echoes our ping time; skip
+            # late pongs to earlier pings that timed out on this shared socket
+            deadline = loop.time() + MC_TIMEOUT
+            while True:
+                data = await asyncio.wait_for(loop.sock_recv(s, 2048), timeout=deadline - loop.time())
+                if not data or data[0] != 0x1c or data[1:9] == payload[1:9]:
+                    break
         if not data or data[0] != 0x1c:
             return {"online": False}
 
         # The server ID string comes after magic, null-terminated, format:
         # "MCPE;MOTD;Protocol;Version;Online;Max;ServerID;LevelName;GameMode;GameModeID"
         # Find the magic and split after it
-        idx = data.find(magic)
+        idx = data.find(RAKNET_MAGIC)
         if idx == -1:
             return {"online": True}
 
-        sid = data[idx+len(magic):].decode("utf-8", errors="ignore").strip("\x00")
-        parts = sid.split(";")
+        # Split the raw bytes and decode only the fields we use; everything from
+        # ServerID on stays in one undecoded trailing part
+        parts = data[idx+len(RAKNET_MAGIC):].rstrip(b"\x00").split(b";", 6)
         # Defensive parsing
-        motd       = parts[1] if len(parts) > 1 else "Minecraft Bedrock"
-        version    = parts[3] if len(parts) > 3 else "Bedrock"
+        motd       = parts[1].decode("utf-8", errors="ignore") if len(parts) > 1 else "Minecraft Bedrock"
+        version    = parts[3].decode("ascii", errors="ignore") if len(parts) > 3 else "Bedrock"
         online     = int(parts[4]) if len(parts) > 4 and parts[4].isdigit() else 0
         max_players= int(parts[5]) if len(parts) > 5 and parts[5].isdigit() else 0
 
@@ -99,21 +272,27 @@ def bedrock_status(host: str, port: int):
             "player_count": online,
             "max_players": max_players,
         }
+    except asyncio.TimeoutError:
+        return {"online": False}
+    except OSError:
+        # e.g. ICMP port unreachable; start from a fresh socket next time
+        drop_bedrock_socket(host, port)
+        return {"online": False}
     except Exception:
         return {"online": False}
     
-@app.get("/api/minecraft")
-def minecraft_info():
-    try:
-        container = subprocess.check_output(
-            ["docker", "inspect", "--format", "{{.State.Status}}", MC_CONTAINER],
-            text=True
-        ).strip()
-    except subprocess.CalledProcessError:
-        container = "unknown"
+@app.get("/api/minecraft", dependencies=[cache_headers(5, 15)])
+async def minecraft_info():
+    return await ttl_cache("minecraft", MC_CACHE_TTL, probe_minecraft,
+                           ok=lambda v: v["server"].get("online"))
 
-    # Use Bedrock ping (not Java Query)
-    mc = bedrock_status(MC_HOST, MC_PORT)
+async def probe_minecraft():
+    # docker inspect and the Bedrock ping (not Java Query) run concurrently
+    container, mc = await asyncio.gather(
+        try_cmd(["docker", "inspect", "--format", "{{.State.Status}}", MC_CONTAINER], timeout=MC_TIMEOUT),
+        bedrock_status(MC_HOST, MC_PORT),
+    )
+    container = container or "unknown"
 
     # If ping failed but container runs, still show Online (fallback)
     if not mc.get("online") and container == "running":
@@ -126,31 +305,88 @@ def minecraft_info():
 
     return {"container": container, "server": mc}
 
-@app.get("/api/metrics")
-def metrics():
-    cpu = psutil.cpu_percent(interval=0.5)
+# Latest CPU reading, refreshed by _cpu_sampler so requests never sleep on psutil
+_last_cpu = 0.0
+
+async def _cpu_sampler():
+    global _last_cpu
+    while True:
+        _last_cpu = psutil.cpu_percent(interval=None)
+        await asyncio.sleep(CPU_SAMPLE_INTERVAL)
+
+@app.on_event("startup")
+async def start_cpu_sampler():
+    # first interval=None call only sets the baseline and always returns 0.0
+    psutil.cpu_percent(interval=None)
+    await asyncio.sleep(0.1)
+    app.state.cpu_sampler = asyncio.create_task(_cpu_sampler())
+
+@app.get("/api/metrics", dependencies=[cache_headers(2, 8)])
+async def metrics():
+    # Shared across requests so bursts of dashboard polls collapse to one probe
+    return await ttl_cache("metrics", METRICS_TTL, probe_metrics)
+
+async def probe_metrics():
+    return await asyncio.get_running_loop().run_in_executor(None, _compute_metrics)
+
+# Mount table rarely changes; avoid re-parsing /proc/mounts on every metrics build
+_parts_cache = (0.0, [])
+_statvfs_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="statvfs")
+# disk_usage calls that timed out and may still be stuck, by mountpoint
+_statvfs_pending: Dict[str, Future] = {}
+
+def skip_mount(mountpoint: str) -> bool:
+    return any(mountpoint == p or mountpoint.startswith(p + "/") for p in DISK_SKIP_PREFIXES)
+
+def disk_usage(mountpoint: str):
+    """psutil.disk_usage with a timeout; None while an earlier call on this mount hangs."""
+    fut = _statvfs_pending.get(mountpoint)
+    if fut is not None and not fut.done():
+        return None  # don't pile another worker onto a hung mount
+    fut = _statvfs_pool.submit(psutil.disk_usage, mountpoint)
+    try:
+        u = fut.result(timeout=DISK_USAGE_TIMEOUT)
+    except FutureTimeout:
+        _statvfs_pending[mountpoint] = fut
+        return None
+    _statvfs_pending.pop(mountpoint, None)
+    return u
+
+def disk_partitions() -> list:
+    global _parts_cache
+    ts, parts = _parts_cache
+    now = time.monotonic()
+    if not parts or now - ts >= PARTITIONS_TTL:
+        parts = [p for p in psutil.disk_partitions(all=False)
+                 if p.fstype in DISK_FSTYPES and not skip_mount(p.mountpoint)]
+        _parts_cache = (now, parts)
+    return parts
+
+def _compute_metrics():
+    cpu = _last_cpu
     vm = psutil.virtual_memory()
     ld1, ld5, ld15 = os.getloadavg() if hasattr(os, "getloadavg") else (0,0,0)
-    uptime = int(time.time() - psutil.boot_time())
+    now = time.time()
+    uptime = int(now - psutil.boot_time())
     disks = []
-    for part in psutil.disk_partitions(all=False):
-        if part.fstype and not part.mountpoint.startswith("/snap"):
-            try:
-                u = psutil.disk_usage(part.mountpoint)
-                disks.append({
-                    "mount": part.mountpoint,
-                    "total": u.total,
-                    "used": u.used,
-                    "free": u.free,
-                    "percent": u.percent
-                })
-            except Exception:
-                pass
+    for part in disk_partitions():
+        try:
+            u = disk_usage(part.mountpoint)
+            if u is None:
+                continue
+            disks.append({
+                "mount": part.mountpoint,
+                "total": u.total,
+                "used": u.used,
+                "free": u.free,
+                "percent": u.percent
+            })
+        except Exception:
+            pass
     net = psutil.net_io_counters()
-    host = socket.gethostname()
     return {
-        "hostname": host,
-        "time": datetime.utcnow().isoformat() + "Z",
+        "hostname": HOSTNAME,
+        "time": datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "cpu_percent": cpu,
         "load": {"1": ld1, "5": ld5, "15": ld15},
         "memory": {
@@ -162,8 +398,8 @@ def metrics():
         "network": {"bytes_sent": net.bytes_sent, "bytes_recv": net.bytes_recv}
     }
 
-@app.get("/api/vpn")
-def vpn_status():
+@app.get("/api/vpn", dependencies=[cache_headers(3, 12)])
+async def vpn_status():
     """
     Return:
     {
@@ -185,14 +421,17 @@ def vpn_status():
       ]
     }
     """
+    return await ttl_cache("vpn", VPN_CACHE_TTL, probe_vpn, ok=lambda v: v.get("running"))
+
+async def probe_vpn():
     iface = WIREGUARD_IFACE
     # need sudo; make sure sudoers allows: www-data NOPASSWD: /usr/bin/wg show wg0 dump
-    raw = try_cmd(["sudo", "/usr/bin/wg", "show", iface, "dump"])
+    raw = await try_cmd(["sudo", "/usr/bin/wg", "show", iface, "dump"])
     if not raw:
         # fallback: is unit active?
         if shutil.which("systemctl"):
             unit = f"wg-quick@{iface}.service"
-            state = try_cmd(["systemctl","is-active",unit])
+            state = await try_cmd(["systemctl","is-active",unit])
             return {"type":"wireguard","iface":iface,"running": state=="active","peers":[]}
         return {"type":"unknown","running":False}
 
@@ -206,42 +445,44 @@ def vpn_status():
     parts = lines[0].split('\t')
     iface_info = {"public_key": parts[1] if len(parts) > 1 else "", "listen_port": int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else None}
 
+    # wg prints 8 tab-separated fields per peer; anything shorter is skipped
+    rows = [l.split('\t') for l in lines[1:] if l.count('\t') >= 7]
     peers=[]
     now=int(time.time())
-    for l in lines[1:]:
-        p=l.split('\t')
-        try:
-            pk      = p[0]
-            endpoint= p[2] if p[2] != "(none)" else ""
-            allowed = p[3] if p[3] != "(none)" else ""
-            hs      = int(p[4]) if p[4].isdigit() else 0
-            rx      = int(p[5]) if p[5].isdigit() else 0
-            tx      = int(p[6]) if p[6].isdigit() else 0
-            keep    = int(p[7]) if p[7].isdigit() else 0
-            peers.append({
-                "peer": pk,
-                "endpoint": endpoint,
-                "allowed_ips": allowed,
-                "latest_handshake": hs,
-                "handshake_age_sec": (now - hs) if hs else None,
-                "transfer_rx": rx,
-                "transfer_tx": tx,
-                "persistent_keepalive": keep or None
-            })
-        except Exception:
-            continue
+    for pk, _, endpoint, allowed, hs, rx, tx, keep, *_ in rows:
+        hs = to_int(hs)
+        peers.append({
+            "peer": pk,
+            "endpoint": endpoint if endpoint != "(none)" else "",
+            "allowed_ips": allowed if allowed != "(none)" else "",
+            "latest_handshake": hs,
+            "handshake_age_sec": (now - hs) if hs else None,
+            "transfer_rx": to_int(rx),
+            "transfer_tx": to_int(tx),
+            "persistent_keepalive": to_int(keep) or None
+        })
 
     return {"type":"wireguard","iface":iface,"running": True, "interface": iface_info, "peers": peers}
 
 
-@app.get("/api/owncloud/recent")
+# Parsed log results, reused until the underlying files change
+_oc_cache = {"key": None, "events": []}
+_backup_cache = {"key": None, "value": None}
+# Parsed tail of BACKUP_HISTORY; appends are read incrementally from pos
+_hist = {"ino": 0, "pos": 0, "ring": collections.deque(maxlen=MAX_LOG_LINES)}
+_hist_lock = threading.Lock()
+
+@app.get("/api/owncloud/recent", dependencies=[cache_headers(10, 30)])
 def owncloud_recent():
-    lines = tail_file(OWNCLOUD_LOG, MAX_LOG_LINES)
-    # Attempt to parse JSON lines (ownCloud logs are JSON by default)
+    key = file_key(OWNCLOUD_LOG)
+    if key is not None and key == _oc_cache["key"]:
+        return {"events": _oc_cache["events"]}
+    # Attempt to parse JSON lines (ownCloud logs are JSON by default);
+    # one event per line and only the last 5 are returned, so read just those
     events = []
-    for L in lines:
+    for Lb in iter_tail_bytes(OWNCLOUD_LOG, min(5, MAX_LOG_LINES)):
         try:
-            obj = json.loads(L)
+            obj = json_loads(Lb)
             events.append({
                 "time": obj.get("time") or obj.get("datetime") or "",
                 "level": obj.get("level",""),
@@ -250,24 +491,52 @@ def owncloud_recent():
             })
         except Exception:
             # fallback raw line
-            events.append({"time":"","level":"","app":"raw","message":L[-200:]})
-    return {"events": events[-5:]}
+            events.append({"time":"","level":"","app":"raw","message":Lb.decode("utf-8", errors="replace")[-200:]})
+    _oc_cache["key"], _oc_cache["events"] = key, events
+    return {"events": events}
+
+def parse_history_line(Lb: bytes) -> dict:
+    try:
+        return json_loads(Lb)
+    except Exception:
+        return {"raw": Lb.decode("utf-8", errors="replace")}
+
+def backup_history() -> list:
+    # backups_summary runs in the threadpool; requests must not interleave here
+    with _hist_lock, open(BACKUP_HISTORY, "rb") as f:
+        st = os.fstat(f.fileno())
+        ring = _hist["ring"]
+        if st.st_ino != _hist["ino"] or st.st_size < _hist["pos"]:
+            # new or rotated/truncated file: start over from its last complete lines
+            ring.clear()
+            start = 0
+            if st.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start = tail_offset(mm, MAX_LOG_LINES, mm.rfind(b"\n") + 1)
+            _hist["ino"], _hist["pos"] = st.st_ino, start
+        f.seek(_hist["pos"])
+        chunk = f.read()
+        # only consume whole lines; a partially written record is picked up next time
+        end = chunk.rfind(b"\n") + 1
+        ring.extend(parse_history_line(Lb) for Lb in chunk[:end].splitlines() if Lb)
+        _hist["pos"] += end
+        return list(ring)[-5:]
 
-@app.get("/api/backups/summary")
+@app.get("/api/backups/summary", dependencies=[cache_headers(60, 120)])
 def backups_summary():
+    key = (file_key(BACKUP_SUMMARY), file_key(BACKUP_HISTORY))
+    if key == _backup_cache["key"]:
+        return _backup_cache["value"]
     latest, history = {}, []
     try:
-        with open(BACKUP_SUMMARY,"r") as f:
-            latest = json.load(f)
+        with open(BACKUP_SUMMARY,"rb") as f:
+            latest = json_loads(f.read())
     except Exception:
         latest = {"status":"unknown"}
     try:
-        lines = tail_file(BACKUP_HISTORY, MAX_LOG_LINES)
-        for L in lines:
-            try:
-                history.append(json.loads(L))
-            except Exception:
-                history.append({"raw": L})
+        history = backup_history()
     except Exception:
         pass
-    return {"latest": latest, "recent": history[-5:]}
+    value = {"latest": latest, "recent": history[-5:]}
+    _backup_cache["key"], _backup_cache["value"] = key, value
+    return value